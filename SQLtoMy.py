@@ -1,5 +1,6 @@
 import sys
 import os
+import io
 import sqlite3
 import signal
 import argparse
@@ -8,11 +9,49 @@ import logging.handlers
 from datetime import datetime
 from tqdm import tqdm
 import re
+import shutil
+import tempfile
+import multiprocessing
 import gzip
-from collections import defaultdict, deque
-import sqlparse
+import binascii
+import itertools
+import heapq
+import hashlib
+import functools
+from collections import defaultdict
+from urllib.request import pathname2url
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    from _sqlvalues import format_row as format_row_fast
+except ImportError:
+    format_row_fast = None
 
 ctrl_c_pressed = False
+logger = logging.getLogger(__name__)
+
+OUTPUT_BUFFER_SIZE = 4 * 1024 * 1024
+SQLITE_READ_PRAGMAS = """
+PRAGMA mmap_size=30000000000;
+PRAGMA cache_size=-262144;
+PRAGMA temp_store=MEMORY;
+PRAGMA query_only=1;
+"""
+NUMERIC_COLUMN_TYPES = ('INTEGER', 'INT', 'BIGINT', 'REAL', 'DOUBLE', 'FLOAT', 'NUMERIC', 'DECIMAL', 'BOOLEAN')
+
+_VIEW_RE = re.compile(r'CREATE\s+VIEW\s+"?(\w+)"?\s+AS\s+(.+)', re.IGNORECASE)
+_TRIGGER_RAISE_RE = re.compile(r'RAISE\((?:ABORT|ROLLBACK|FAIL),\s*', re.IGNORECASE)
+_DEFAULT_FN_RE = re.compile(r'^\w+\(.*\)$')
+
+# Drops control characters (except tab, LF, CR) and escapes quotes/backslashes for SQL string literals
+_SQL_TRANSLATE = {i: None for i in range(32) if i not in (9, 10, 13)}
+_SQL_TRANSLATE[127] = None
+_SQL_TRANSLATE[ord("'")] = "''"
+_SQL_TRANSLATE[ord("\\")] = "\\\\"
 
 def signal_handler(sig, frame):
     global ctrl_c_pressed
@@ -41,9 +80,14 @@ def setup_logging(no_log_file=False, log_rotate_size=1048576, log_level="INFO"):
 def escape_sql_identifier(name):
     return name.replace('`', '``')
 
+def _short_hash(name):
+    # Unlike hash(), stable across runs regardless of PYTHONHASHSEED
+    return hashlib.blake2b(name.encode('utf-8'), digest_size=3).hexdigest()
+
+@functools.lru_cache(maxsize=None)
 def truncate_identifier(name, max_length=64):
     if len(name) > max_length:
-        return name[:max_length-8] + f"_{hash(name) % 10000}"
+        return name[:max_length-8] + f"_{_short_hash(name)}"
     return name
 
 def sanitize_sql_value(value):
@@ -51,12 +95,140 @@ def sanitize_sql_value(value):
         return ''.join(c for c in value if c.isprintable()).replace('\0', '')
     return value
 
+def write_text(f, text):
+    f.write(text.encode('utf-8'))
+
+def format_row(row, formatters, column_names):
+    values = []
+    for formatter, col_name, col_value in zip(formatters, column_names, row):
+        if col_value is None:
+            values.append(b'NULL')
+            continue
+        try:
+            values.append(formatter(col_value))
+        except Exception as e:
+            logger.warning(f"Error processing value for {col_name}: {e}")
+            values.append(b'NULL')
+    return b"(" + b", ".join(values) + b")"
+
+def write_insert(f, insert_prefix, values_list):
+    f.write(insert_prefix)
+    f.write(b",\n  ".join(values_list))
+    f.write(b";\n")
+
+def format_sql_value(value):
+    if isinstance(value, str):
+        return b"'" + value.translate(_SQL_TRANSLATE).encode('utf-8', 'surrogatepass') + b"'"
+    if isinstance(value, (int, float)):
+        return str(value).encode('ascii')
+    return b"'" + str(value).translate(_SQL_TRANSLATE).encode('utf-8', 'surrogatepass') + b"'"
+
+def _format_blob_literal(value):
+    # 0x... hex literals load without UNHEX(); an empty 0x is invalid, so empty BLOBs use X''
+    if not value:
+        return b"X''"
+    return b"0x" + binascii.hexlify(value)
+
+def _format_text(value):
+    if value.__class__ is str:
+        return b"'" + value.translate(_SQL_TRANSLATE).encode('utf-8', 'surrogatepass') + b"'"
+    return format_sql_value(value)
+
+def _format_number(value):
+    if value.__class__ is int or value.__class__ is float:
+        return str(value).encode('ascii')
+    return format_sql_value(value)
+
+def make_column_formatter(col_type, table_name, col_name, max_blob_size=1048576, blob_dir=None,
+                          dump_file=None, relative_blob_paths=False):
+    # Picked once per column from the declared type; values of another type fall back to format_sql_value
+    if col_type in NUMERIC_COLUMN_TYPES:
+        return _format_number
+    if col_type != 'BLOB':
+        return _format_text
+
+    if not blob_dir:
+        def format_blob(value):
+            if not isinstance(value, bytes):
+                return format_sql_value(value)
+            if len(value) > max_blob_size:
+                logger.warning(f"Skipping large BLOB in {col_name} (size: {len(value)} bytes)")
+                return b'NULL'
+            return _format_blob_literal(value)
+        return format_blob
+
+    blob_counter = itertools.count()
+    os.makedirs(blob_dir, exist_ok=True)
+    if relative_blob_paths:
+        # LOAD_FILE paths are relative to the dump file's directory, resolved once per column
+        load_dir = os.path.relpath(blob_dir, os.path.dirname(dump_file))
+    else:
+        load_dir = blob_dir
+
+    def format_blob_external(value):
+        if not isinstance(value, bytes):
+            return format_sql_value(value)
+        if len(value) <= max_blob_size:
+            return _format_blob_literal(value)
+        blob_filename = f"{table_name}_{col_name}_{next(blob_counter)}.bin"
+        blob_path = os.path.join(blob_dir, blob_filename)
+        try:
+            with open(blob_path, 'wb') as blob_file:
+                blob_file.write(value)
+        except OSError as e:
+            logger.warning(f"Error writing BLOB file {blob_path}: {e}")
+            return b'NULL'
+        return f"LOAD_FILE('{os.path.join(load_dir, blob_filename)}')".encode('utf-8')
+    return format_blob_external
+
+def find_dependency_cycles(tables, graph):
+    # Iterative Tarjan SCC over the given tables; returns components that form a cycle
+    table_set = set(tables)
+    index_of = {}
+    lowlink = {}
+    stack = []
+    on_stack = set()
+    cycles = []
+    for root in tables:
+        if root in index_of:
+            continue
+        index_of[root] = lowlink[root] = len(index_of)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.get(root, ())))]
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in table_set:
+                    continue
+                if neighbor not in index_of:
+                    index_of[neighbor] = lowlink[neighbor] = len(index_of)
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(graph.get(neighbor, ()))))
+                    break
+                if neighbor in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[neighbor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in graph.get(node, ()):
+                        cycles.append(component[::-1])
+    return cycles
+
 def topological_sort_tables(tables, foreign_keys):
     graph = defaultdict(list)
-    in_degree = defaultdict(int)
-    
-    for table in tables:
-        in_degree[table] = 0
+    in_degree = {table: 0 for table in tables}
     
     for table, fk_info in foreign_keys.items():
         for fk in fk_info:
@@ -64,22 +236,26 @@ def topological_sort_tables(tables, foreign_keys):
             graph[ref_table].append(table)
             in_degree[table] += 1
     
-    queue = deque([t for t in tables if in_degree[t] == 0])
+    # A heap keyed by table name keeps the output order deterministic
+    heap = [t for t in tables if in_degree[t] == 0]
+    heapq.heapify(heap)
     sorted_tables = []
-    visited = set()
     
-    while queue:
-        table = queue.popleft()
+    while heap:
+        table = heapq.heappop(heap)
         sorted_tables.append(table)
-        visited.add(table)
         for neighbor in graph[table]:
             in_degree[neighbor] -= 1
             if in_degree[neighbor] == 0:
-                queue.append(neighbor)
+                heapq.heappush(heap, neighbor)
     
     if len(sorted_tables) != len(tables):
         logger.warning("Cyclic dependencies detected. Tables may need manual reordering in the SQL file.")
-        sorted_tables.extend([t for t in tables if t not in sorted_tables])
+        present = set(sorted_tables)
+        unresolved = [t for t in tables if t not in present]
+        for cycle in find_dependency_cycles(unresolved, graph):
+            logger.warning("Cycle: %s", " -> ".join(cycle))
+        sorted_tables.extend(unresolved)
     
     return sorted_tables
 
@@ -119,33 +295,152 @@ def sqlite_to_mysql_type(sqlite_type, max_length=None, nullable=False, max_value
     
     return f"{base_type}{' DEFAULT NULL' if nullable else ' NOT NULL'}"
 
+def write_parallel_sections(output, ddl_sections, data_tasks, trailing_ddl, parallel, dump_file):
+    # Interleave buffered table DDL with worker fragments so the dump matches the serial statement order.
+    # Fragments live in one directory next to the dump, removed as a whole even if workers were terminated.
+    part_files = {}
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(dump_file))) as part_dir:
+        if data_tasks:
+            logger.info(f"Exporting data for {len(data_tasks)} tables using {parallel} processes")
+            worker_tasks = [(part_dir,) + task for task in data_tasks]
+            with multiprocessing.Pool(parallel, initializer=_init_export_worker) as pool:
+                for item_name, part_path in pool.imap_unordered(_export_table_data_worker, worker_tasks):
+                    part_files[item_name] = part_path
+                    logger.info(f"Finished data export for {item_name}")
+        for ddl, task in zip(ddl_sections, data_tasks):
+            output.write(ddl)
+            with open(part_files[task[1]], 'rb') as part_file:
+                shutil.copyfileobj(part_file, output, OUTPUT_BUFFER_SIZE)
+        output.write(trailing_ddl)
+
+def connect_sqlite_readonly(db_file):
+    db_path = os.path.abspath(db_file)
+    uri = f"file:{pathname2url(db_path)}?mode=ro"
+    # immutable=1 skips locking and change detection, but would also ignore a pending WAL file
+    if not os.path.exists(f"{db_path}-wal"):
+        uri += "&immutable=1"
+    conn = sqlite3.connect(uri, uri=True)
+    conn.executescript(SQLITE_READ_PRAGMAS)
+    return conn
+
+def export_table_data(f, conn, item_name, columns_info, column_metadata, batch_size=1000,
+                      max_blob_size=1048576, blob_dir=None, dump_file=None, relative_blob_paths=False,
+                      verify_data=False, max_insert_bytes=262144, show_progress=True):
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT COUNT(*) FROM `{escape_sql_identifier(item_name)}`;")
+    total_rows = cursor.fetchone()[0]
+
+    if total_rows == 0:
+        logger.info(f"Skipping empty table: {item_name}")
+        return 0
+
+    logger.info(f"Exporting {total_rows} rows from {item_name}")
+    columns_names = ', '.join([f"`{escape_sql_identifier(col[1])}`" for col in columns_info])
+    insert_prefix = f"INSERT INTO `{escape_sql_identifier(item_name)}` ({columns_names}) VALUES\n  ".encode('utf-8')
+
+    column_names = [col[1] for col in columns_info]
+    formatters = tuple(
+        make_column_formatter(column_metadata[col_name]['type'], item_name, col_name, max_blob_size,
+                              blob_dir, dump_file, relative_blob_paths)
+        for col_name in column_names
+    )
+
+    pbar = tqdm(total=total_rows, desc=f"Exporting {item_name}", disable=not show_progress)
+    values_list = []
+    statement_bytes = len(insert_prefix) + 2
+
+    data_cursor = conn.cursor()
+    data_cursor.arraysize = batch_size
+    data_cursor.execute(f"SELECT {columns_names} FROM `{escape_sql_identifier(item_name)}`;")
+    while True:
+        if ctrl_c_pressed:
+            logger.info("Ctrl+C detected. Exiting gracefully.")
+            sys.exit(0)
+
+        rows = data_cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        for row in rows:
+            if format_row_fast is not None:
+                row_sql = format_row_fast(row, formatters, column_names, logger)
+            else:
+                row_sql = format_row(row, formatters, column_names)
+            # Keep each INSERT under the byte budget; an oversized row still gets a statement of its own
+            if values_list and statement_bytes + len(row_sql) > max_insert_bytes:
+                write_insert(f, insert_prefix, values_list)
+                values_list = []
+                statement_bytes = len(insert_prefix) + 2
+            values_list.append(row_sql)
+            statement_bytes += len(row_sql) + 4
+
+        pbar.update(len(rows))
+    data_cursor.close()
+    if values_list:
+        write_insert(f, insert_prefix, values_list)
+
+    pbar.close()
+    if verify_data:
+        cursor.execute(f"SELECT COUNT(*) FROM `{escape_sql_identifier(item_name)}`;")
+        actual_rows = cursor.fetchone()[0]
+        if actual_rows != total_rows:
+            logger.warning(f"Data verification failed for {item_name}: expected {total_rows}, found {actual_rows}")
+    logger.info(f"Exported {total_rows} rows from {item_name}")
+    return total_rows
+
+def _init_export_worker():
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def _export_table_data_worker(task):
+    part_dir, db_file, item_name, columns_info, column_metadata, options = task
+    conn = connect_sqlite_readonly(db_file)
+    part_file = tempfile.NamedTemporaryFile('wb', suffix='.sql', dir=part_dir, delete=False,
+                                            buffering=OUTPUT_BUFFER_SIZE)
+    try:
+        with part_file:
+            export_table_data(part_file, conn, item_name, columns_info, column_metadata,
+                              show_progress=False, **options)
+    finally:
+        conn.close()
+    return item_name, part_file.name
+
 def create_sql_dump(db_file, dump_file, drop_table=True, export_mode="both", 
                     engine="InnoDB", charset="utf8mb4", collate="utf8mb4_unicode_ci", 
                     batch_size=1000, compress=False, max_blob_size=1048576, blob_dir=None, 
                     fulltext=False, partition=None, tablespace=None, mysql_version="8.0", 
-                    verify_data=False, relative_blob_paths=False):
+                    verify_data=False, relative_blob_paths=False, parallel=1, compress_level=None,
+                    compress_format="gzip", max_insert_bytes=262144):
     global logger
     logger = setup_logging()
     logger.info("Starting SQLite to MySQL conversion")
     
+    if not os.path.exists(db_file):
+        logger.error(f"SQLite database file does not exist: {db_file}")
+        sys.exit(1)
+
     try:
-        conn = sqlite3.connect(db_file)
+        conn = connect_sqlite_readonly(db_file)
         cursor = conn.cursor()
         logger.info(f"Connected to SQLite database: {db_file}")
     except sqlite3.OperationalError as e:
         logger.error(f"Failed to connect to SQLite database: {e}")
         sys.exit(1)
 
-    if not os.path.exists(db_file):
-        logger.error(f"SQLite database file does not exist: {db_file}")
-        sys.exit(1)
-
     try:
         if compress:
-            logger.info(f"Output will be compressed as {dump_file}")
-            output_file = gzip.open(dump_file, 'wt', encoding='utf-8')
+            logger.info(f"Output will be compressed with {compress_format} as {dump_file}")
+            if compress_format == "zstd":
+                if zstandard is None:
+                    logger.error("zstd compression requires the 'zstandard' package (pip install zstandard)")
+                    sys.exit(1)
+                level = 3 if compress_level is None else compress_level
+                compressor = zstandard.ZstdCompressor(level=level, threads=-1)
+                raw_output = compressor.stream_writer(open(dump_file, 'wb'), write_return_read=True)
+            else:
+                level = 1 if compress_level is None else compress_level
+                raw_output = gzip.GzipFile(dump_file, 'wb', compresslevel=level)
+            output_file = io.BufferedWriter(raw_output, buffer_size=OUTPUT_BUFFER_SIZE)
         else:
-            output_file = open(dump_file, 'w', encoding='utf-8')
+            output_file = open(dump_file, 'wb', buffering=OUTPUT_BUFFER_SIZE)
     except OSError as e:
         logger.error(f"Failed to open output file {dump_file}: {e}")
         sys.exit(1)
@@ -154,31 +449,48 @@ def create_sql_dump(db_file, dump_file, drop_table=True, export_mode="both",
     cursor.execute("SELECT name, sql FROM sqlite_master WHERE type IN ('table', 'view', 'trigger');")
     items = cursor.fetchall()
     tables = [item[0] for item in items if item[0] != 'sqlite_sequence' and item[1] and item[1].lower().startswith('create table')]
-    table_dependencies = {}
-    for table in tables:
-        cursor.execute(f"PRAGMA foreign_key_list(`{table}`);")
-        table_dependencies[table] = cursor.fetchall()
+    # Fetch foreign keys of every table in one query instead of one PRAGMA per table
+    table_dependencies = {table: [] for table in tables}
+    cursor.execute("SELECT m.name, fk.* FROM sqlite_master AS m "
+                   "JOIN pragma_foreign_key_list(m.name) AS fk WHERE m.type = 'table';")
+    for row in cursor.fetchall():
+        if row[0] in table_dependencies:
+            table_dependencies[row[0]].append(row[1:])
     
     sorted_tables = topological_sort_tables(tables, table_dependencies)
+    table_order = {table: i for i, table in enumerate(sorted_tables)}
     sorted_items = []
     for name, sql in items:
         if name == 'sqlite_sequence':
             continue
-        if sql and sql.lower().startswith('create table') and name in sorted_tables:
-            sorted_items.append((name, sql, sorted_tables.index(name)))
+        if sql and sql.lower().startswith('create table') and name in table_order:
+            sorted_items.append((name, sql, table_order[name]))
         else:
             sorted_items.append((name, sql, len(sorted_tables)))
     sorted_items.sort(key=lambda x: x[2])
     
     total_items = len(sorted_items)
+    data_options = {
+        'batch_size': batch_size,
+        'max_blob_size': max_blob_size,
+        'blob_dir': blob_dir,
+        'dump_file': dump_file,
+        'relative_blob_paths': relative_blob_paths,
+        'verify_data': verify_data,
+        'max_insert_bytes': max_insert_bytes
+    }
+    data_tasks = []
+    ddl_sections = []
     logger.info(f"Found {total_items} items (tables, views, triggers) to export")
 
-    with output_file as f:
-        f.write(f"-- SQL Dump generated by sqlite_to_mysql.py\n")
-        f.write(f"-- Source DB: {db_file}\n")
-        f.write(f"-- Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        f.write("SET FOREIGN_KEY_CHECKS = 0;\n")
-        f.write("START TRANSACTION;\n\n")
+    with output_file as dump_output:
+        # With parallel workers, table DDL is buffered until the data fragments are ready
+        f = io.BytesIO() if parallel > 1 else dump_output
+        write_text(f, f"-- SQL Dump generated by sqlite_to_mysql.py\n")
+        write_text(f, f"-- Source DB: {db_file}\n")
+        write_text(f, f"-- Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        write_text(f, "SET FOREIGN_KEY_CHECKS = 0;\n")
+        write_text(f, "START TRANSACTION;\n\n")
 
         pbar_total = tqdm(total=total_items, desc="Overall Progress")
         for idx, (item_name, item_sql, _) in enumerate(sorted_items, 1):
@@ -188,25 +500,28 @@ def create_sql_dump(db_file, dump_file, drop_table=True, export_mode="both",
             logger.info(f"Processing item: {item_name} ({idx}/{total_items})")
             pbar_total.update(1)
 
+            # Tables sort first; views and triggers must only be created after all data is loaded
+            if (f is not dump_output and item_sql
+                    and item_sql.lower().startswith(('create view', 'create trigger'))):
+                write_parallel_sections(dump_output, ddl_sections, data_tasks, f.getvalue(), parallel,
+                                        dump_file)
+                f = dump_output
+
             # Handle views
             if item_sql and item_sql.lower().startswith('create view'):
                 if export_mode in ("structure", "both"):
-                    f.write(f"\n-- View: {escape_sql_identifier(item_name)}\n")
-                    view_sql = re.sub(r'CREATE\s+VIEW\s+"?(\w+)"?\s+AS\s+(.+)', 
-                                      r'CREATE VIEW `\1` AS \2', item_sql, flags=re.IGNORECASE)
-                    f.write(f"{view_sql};\n")
+                    write_text(f, f"\n-- View: {escape_sql_identifier(item_name)}\n")
+                    view_sql = _VIEW_RE.sub(r'CREATE VIEW `\1` AS \2', item_sql)
+                    write_text(f, f"{view_sql};\n")
                 continue
 
             # Handle triggers
             if item_sql and item_sql.lower().startswith('create trigger'):
                 if export_mode in ("structure", "both"):
-                    f.write(f"\n-- Trigger: {escape_sql_identifier(item_name)}\n")
-                    f.write(f"-- Warning: Trigger may need manual adjustment for MySQL compatibility\n")
-                    formatted_sql = sqlparse.format(item_sql, reindent=True)
-                    formatted_sql = formatted_sql.replace("RAISE(ABORT, ", "SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = ")
-                    formatted_sql = formatted_sql.replace("RAISE(ROLLBACK, ", "SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = ")
-                    formatted_sql = formatted_sql.replace("RAISE(FAIL, ", "SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = ")
-                    f.write(f"{formatted_sql};\n")
+                    write_text(f, f"\n-- Trigger: {escape_sql_identifier(item_name)}\n")
+                    write_text(f, f"-- Warning: Trigger may need manual adjustment for MySQL compatibility\n")
+                    formatted_sql = _TRIGGER_RAISE_RE.sub("SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = ", item_sql)
+                    write_text(f, f"{formatted_sql};\n")
                 continue
 
             # Process tables
@@ -230,24 +545,29 @@ def create_sql_dump(db_file, dump_file, drop_table=True, export_mode="both",
                     'max_length': 0,
                     'max_value': 0
                 }
-                
+                column_metadata[col_name] = metadata
+
+            # Collect max length/value for all columns in a single table scan
+            aggregates = []
+            aggregate_targets = []
+            for col_name, metadata in column_metadata.items():
+                if metadata['type'] == 'TEXT':
+                    aggregates.append(f"MAX(LENGTH(`{escape_sql_identifier(col_name)}`))")
+                    aggregate_targets.append((col_name, 'max_length'))
+                elif metadata['type'] == 'INTEGER':
+                    aggregates.append(f"MAX(`{escape_sql_identifier(col_name)}`)")
+                    aggregate_targets.append((col_name, 'max_value'))
+            if aggregates:
                 try:
-                    if col_type == 'TEXT':
-                        cursor.execute(f"SELECT MAX(LENGTH(`{col_name}`)) FROM `{item_name}`;")
-                        max_length = cursor.fetchone()[0] or 0
-                        metadata['max_length'] = max_length
-                    elif col_type == 'INTEGER':
-                        cursor.execute(f"SELECT MAX(`{col_name}`) FROM `{item_name}`;")
-                        max_value = cursor.fetchone()[0] or 0
-                        metadata['max_value'] = max_value
+                    cursor.execute(f"SELECT {', '.join(aggregates)} FROM `{escape_sql_identifier(item_name)}`;")
+                    for (col_name, key), value in zip(aggregate_targets, cursor.fetchone()):
+                        column_metadata[col_name][key] = value or 0
                 except sqlite3.Error as e:
-                    logger.warning(f"Could not calculate max length/value for {col_name}: {e}")
-                
-                column_metadata[col_name] = metadata
+                    logger.warning(f"Could not calculate max length/value for columns of {item_name}: {e}")
 
             if export_mode in ("structure", "both"):
                 if drop_table:
-                    f.write(f"DROP TABLE IF EXISTS `{escape_sql_identifier(item_name)}`;\n")
+                    write_text(f, f"DROP TABLE IF EXISTS `{escape_sql_identifier(item_name)}`;\n")
 
                 columns = []
                 for col in columns_info:
@@ -265,7 +585,7 @@ def create_sql_dump(db_file, dump_file, drop_table=True, export_mode="both",
                             mysql_type += " DEFAULT NULL"
                         elif meta['type'] in ('TEXT', 'DATETIME', 'DATE'):
                             default = sanitize_sql_value(meta['default_value'])
-                            if re.match(r'^\w+\(.*\)$', default):
+                            if _DEFAULT_FN_RE.match(default):
                                 logger.warning(f"Skipping complex default value for {col_name}: {default}")
                             else:
                                 mysql_type += f" DEFAULT '{default}'"
@@ -283,25 +603,26 @@ def create_sql_dump(db_file, dump_file, drop_table=True, export_mode="both",
                 if tablespace:
                     table_options.append(f"TABLESPACE {tablespace}")
 
-                f.write(f"CREATE TABLE `{escape_sql_identifier(item_name)}` (\n")
-                f.write(f"  {',\n  '.join(columns)}\n")
-                f.write(f") ENGINE={engine} DEFAULT CHARSET={charset} COLLATE={collate}")
+                write_text(f, f"CREATE TABLE `{escape_sql_identifier(item_name)}` (\n")
+                write_text(f, "  " + ",\n  ".join(columns) + "\n")
+                write_text(f, f") ENGINE={engine} DEFAULT CHARSET={charset} COLLATE={collate}")
                 if table_options:
-                    f.write(" " + " ".join(table_options))
-                f.write(";\n\n")
+                    write_text(f, " " + " ".join(table_options))
+                write_text(f, ";\n\n")
 
                 # Export indexes
-                cursor.execute(f"PRAGMA index_list(`{item_name}`);")
-                indexes = cursor.fetchall()
-                for index in indexes:
-                    index_name = truncate_identifier(index[1])
-                    unique = "UNIQUE " if index[2] else ""
-                    cursor.execute(f"PRAGMA index_info(`{index_name}`);")
-                    index_columns = [col[2] for col in cursor.fetchall()]
+                cursor.execute("SELECT il.name, il.\"unique\", ii.name FROM pragma_index_list(?) AS il "
+                               "JOIN pragma_index_info(il.name) AS ii ORDER BY il.seq, ii.seqno;", (item_name,))
+                indexes = {}
+                for index_name, is_unique, index_column in cursor.fetchall():
+                    indexes.setdefault((index_name, is_unique), []).append(index_column)
+                for (index_name, is_unique), index_columns in indexes.items():
+                    index_name = truncate_identifier(index_name)
+                    unique = "UNIQUE " if is_unique else ""
                     if index_name.startswith('sqlite_autoindex'):
-                        index_name = truncate_identifier(f"idx_{item_name}_{'_'.join(index_columns)}_{hash(index_name) % 10000}")
+                        index_name = truncate_identifier(f"idx_{item_name}_{'_'.join(index_columns)}_{_short_hash(index_name)}")
                     columns_sql = ', '.join([f"`{escape_sql_identifier(col)}`" for col in index_columns])
-                    f.write(f"CREATE {unique}INDEX `{escape_sql_identifier(index_name)}` "
+                    write_text(f, f"CREATE {unique}INDEX `{escape_sql_identifier(index_name)}` "
                             f"ON `{escape_sql_identifier(item_name)}` ({columns_sql});\n")
 
                 # Add full-text indexes if requested
@@ -311,7 +632,7 @@ def create_sql_dump(db_file, dump_file, drop_table=True, export_mode="both",
                     else:
                         fulltext_cols = [f"`{escape_sql_identifier(col)}`" for col, meta in column_metadata.items() if meta['type'] == 'TEXT']
                         if fulltext_cols:
-                            f.write(f"CREATE FULLTEXT INDEX `fulltext_{item_name}` "
+                            write_text(f, f"CREATE FULLTEXT INDEX `fulltext_{item_name}` "
                                     f"ON `{escape_sql_identifier(item_name)}` ({', '.join(fulltext_cols)});\n")
 
                 # Export foreign keys from pre-fetched dependencies
@@ -322,113 +643,34 @@ def create_sql_dump(db_file, dump_file, drop_table=True, export_mode="both",
                     ref_column = fk[4]
                     on_delete = fk[5] if fk[5] else 'NO ACTION'
                     on_update = fk[6] if fk[6] else 'NO ACTION'
-                    constraint_name = truncate_identifier(f"fk_{item_name}_{fk_column}_{hash(fk_column) % 10000}")
-                    f.write(
+                    constraint_name = truncate_identifier(f"fk_{item_name}_{fk_column}_{_short_hash(fk_column)}")
+                    write_text(f, 
                         f"ALTER TABLE `{escape_sql_identifier(item_name)}` ADD CONSTRAINT "
                         f"`{constraint_name}` FOREIGN KEY (`{escape_sql_identifier(fk_column)}`) "
                         f"REFERENCES `{escape_sql_identifier(ref_table)}` (`{escape_sql_identifier(ref_column)}`) "
                         f"ON DELETE {on_delete} ON UPDATE {on_update};\n"
                     )
-                f.write("\n")
+                write_text(f, "\n")
 
             if export_mode in ("data", "both"):
-                cursor.execute(f"SELECT COUNT(*) FROM `{item_name}`;")
-                total_rows = cursor.fetchone()[0]
-                
-                if total_rows == 0:
-                    logger.info(f"Skipping empty table: {item_name}")
-                    continue
-                
-                logger.info(f"Exporting {total_rows} rows from {item_name}")
-                columns_names = ', '.join([f"`{escape_sql_identifier(col[1])}`" for col in columns_info])
-                
-                offset = 0
-                pbar = tqdm(total=total_rows, desc=f"Exporting {item_name}")
-                values_list = []
-                
-                while offset < total_rows:
-                    if ctrl_c_pressed:
-                        logger.info("Ctrl+C detected. Exiting gracefully.")
-                        sys.exit(0)
-                    
-                    cursor.execute(f"SELECT * FROM `{item_name}` LIMIT {batch_size} OFFSET {offset};")
-                    row_count = 0
-                    for row in cursor:
-                        values = []
-                        for i, col_value in enumerate(row):
-                            col_name = columns_info[i][1]
-                            col_type = column_metadata[col_name]['type']
-                            
-                            try:
-                                if col_value is None:
-                                    values.append('NULL')
-                                elif col_type == 'BLOB' and isinstance(col_value, bytes):
-                                    if blob_dir and len(col_value) > max_blob_size:
-                                        blob_filename = f"{item_name}_{col_name}_{offset}_{i}.bin"
-                                        blob_path = os.path.join(blob_dir, blob_filename)
-                                        os.makedirs(blob_dir, exist_ok=True)
-                                        try:
-                                            with open(blob_path, 'wb') as blob_file:
-                                                blob_file.write(col_value)
-                                            if not os.path.exists(blob_path):
-                                                logger.warning(f"Failed to write BLOB file {blob_path}")
-                                                values.append('NULL')
-                                            else:
-                                                if relative_blob_paths:
-                                                    rel_path = os.path.relpath(blob_path, os.path.dirname(dump_file))
-                                                    values.append(f"LOAD_FILE('{rel_path}')")
-                                                else:
-                                                    values.append(f"LOAD_FILE('{blob_path}')")
-                                        except OSError as e:
-                                            logger.warning(f"Error writing BLOB file {blob_path}: {e}")
-                                            values.append('NULL')
-                                    elif len(col_value) > max_blob_size:
-                                        logger.warning(f"Skipping large BLOB in {col_name} (size: {len(col_value)} bytes)")
-                                        values.append('NULL')
-                                    else:
-                                        values.append(f"UNHEX('{col_value.hex()}')")
-                                elif isinstance(col_value, str):
-                                    sanitized = sanitize_sql_value(col_value)
-                                    values.append(f"'{sanitized.replace(\"'\", \"''\")}'")
-                                elif isinstance(col_value, (int, float)):
-                                    values.append(str(col_value))
-                                else:
-                                    sanitized = sanitize_sql_value(str(col_value))
-                                    values.append(f"'{sanitized.replace(\"'\", \"''\")}'")
-                            except Exception as e:
-                                logger.warning(f"Error processing value for {col_name}: {e}")
-                                values.append('NULL')
-                        
-                        values_list.append(f"({', '.join(values)})")
-                        row_count += 1
-                    
-                    if values_list:
-                        for i in range(0, len(values_list), 100):
-                            chunk = values_list[i:i+100]
-                            insert_sql = (
-                                f"INSERT INTO `{escape_sql_identifier(item_name)}` ({columns_names}) VALUES\n"
-                                f"  {',\n  '.join(chunk)};\n"
-                            )
-                            f.write(insert_sql)
-                        values_list = []
-                    
-                    offset += row_count
-                    pbar.update(row_count)
-                
-                pbar.close()
-                if verify_data:
-                    cursor.execute(f"SELECT COUNT(*) FROM `{item_name}`;")
-                    actual_rows = cursor.fetchone()[0]
-                    if actual_rows != total_rows:
-                        logger.warning(f"Data verification failed for {item_name}: expected {total_rows}, found {actual_rows}")
-                logger.info(f"Exported {total_rows} rows from {item_name}")
-
-        f.write("\nCOMMIT;\n")
-        f.write("SET FOREIGN_KEY_CHECKS = 1;\n")
+                if parallel > 1:
+                    ddl_sections.append(f.getvalue())
+                    data_tasks.append((db_file, item_name, columns_info, column_metadata, data_options))
+                    f = io.BytesIO()
+                else:
+                    export_table_data(f, conn, item_name, columns_info, column_metadata, **data_options)
+
+        if f is not dump_output:
+            write_parallel_sections(dump_output, ddl_sections, data_tasks, f.getvalue(), parallel,
+                                        dump_file)
+            f = dump_output
+
+        write_text(f, "\nCOMMIT;\n")
+        write_text(f, "SET FOREIGN_KEY_CHECKS = 1;\n")
     
     pbar_total.close()
     conn.close()
-    logger.info(f"Conversion completed successfully. Output file: {dump_file}{'.gz' if compress else ''}")
+    logger.info(f"Conversion completed successfully. Output file: {dump_file}")
 
 def parse_arguments():
     parser = argparse.ArgumentParser(
@@ -451,10 +693,16 @@ def parse_arguments():
                        help="MySQL collation")
     parser.add_argument("--batch-size", type=int, default=1000,
                        help="Batch size for data export")
+    parser.add_argument("--max-insert-bytes", type=int, default=262144,
+                       help="Approximate maximum size in bytes of each extended INSERT statement")
     parser.add_argument("--no-log-file", action="store_true",
                        help="Disable logging to file")
     parser.add_argument("--compress", action="store_true",
                        help="Compress output SQL file using gzip")
+    parser.add_argument("--compress-format", choices=["gzip", "zstd"], default="gzip",
+                       help="Compression format used with --compress (zstd requires the zstandard package)")
+    parser.add_argument("--compress-level", type=int, default=None,
+                       help="Compression level (defaults to 1 for gzip and 3 for zstd)")
     parser.add_argument("--max-blob-size", type=int, default=1048576,
                        help="Maximum BLOB size in bytes before skipping or externalizing")
     parser.add_argument("--blob-dir", type=str, default=None,
@@ -473,6 +721,8 @@ def parse_arguments():
                        help="Use relative paths for BLOB files in LOAD_FILE")
     parser.add_argument("--log-rotate-size", type=int, default=1048576,
                        help="Max log file size in bytes before rotation")
+    parser.add_argument("--parallel", type=int, default=1,
+                       help="Number of worker processes for exporting table data")
     parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
                        default="INFO", help="Logging level")
     
@@ -505,12 +755,22 @@ if __name__ == '__main__':
     if args.fulltext and args.mysql_version.startswith('5') and args.engine != 'MyISAM':
         logger.error("FULLTEXT indexes are only supported with MyISAM in MySQL 5.x")
         sys.exit(1)
-    
+
+    if args.compress_level is not None:
+        if args.compress_format == 'zstd':
+            if zstandard is not None and args.compress_level > zstandard.MAX_COMPRESSION_LEVEL:
+                logger.error(f"Invalid compress level for zstd: {args.compress_level}. "
+                             f"Maximum is {zstandard.MAX_COMPRESSION_LEVEL}")
+                sys.exit(1)
+        elif not 0 <= args.compress_level <= 9:
+            logger.error(f"Invalid compress level for gzip: {args.compress_level}. Valid range: 0-9")
+            sys.exit(1)
+
     if not args.mysql_dump_file:
         base_name = os.path.splitext(args.sqlite_db_file)[0]
         args.mysql_dump_file = f"{base_name}_mysql.sql"
         if args.compress:
-            args.mysql_dump_file += '.gz'
+            args.mysql_dump_file += '.zst' if args.compress_format == 'zstd' else '.gz'
     
     if args.blob_dir and not os.path.exists(args.blob_dir):
         os.makedirs(args.blob_dir, exist_ok=True)
@@ -532,5 +792,9 @@ if __name__ == '__main__':
         tablespace=args.tablespace,
         mysql_version=args.mysql_version,
         verify_data=args.verify_data,
-        relative_blob_paths=args.relative_blob_paths
+        relative_blob_paths=args.relative_blob_paths,
+        parallel=args.parallel,
+        compress_level=args.compress_level,
+        compress_format=args.compress_format,
+        max_insert_bytes=args.max_insert_bytes
   )
@@ -0,0 +1,112 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# Optional C accelerator for SQLtoMy.py; build with: python setup.py build_ext --inplace
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_GET_SIZE, PyBytes_FromStringAndSize
+from libc.stdlib cimport malloc, realloc, free
+from libc.string cimport memcpy
+
+cdef extern from "Python.h":
+    const char *PyUnicode_AsUTF8AndSize(object unicode, Py_ssize_t *size) except NULL
+
+cdef struct Buffer:
+    char *data
+    Py_ssize_t size
+    Py_ssize_t capacity
+
+cdef int buffer_reserve(Buffer *buf, Py_ssize_t extra) except -1:
+    cdef Py_ssize_t needed = buf.size + extra
+    cdef Py_ssize_t capacity
+    cdef char *data
+    if needed <= buf.capacity:
+        return 0
+    capacity = buf.capacity * 2
+    if capacity < needed:
+        capacity = needed
+    data = <char *>realloc(buf.data, capacity)
+    if data == NULL:
+        raise MemoryError()
+    buf.data = data
+    buf.capacity = capacity
+    return 0
+
+cdef int buffer_write(Buffer *buf, const char *src, Py_ssize_t size) except -1:
+    buffer_reserve(buf, size)
+    memcpy(buf.data + buf.size, src, size)
+    buf.size += size
+    return 0
+
+cdef int buffer_write_bytes(Buffer *buf, bytes value) except -1:
+    return buffer_write(buf, PyBytes_AS_STRING(value), PyBytes_GET_SIZE(value))
+
+cdef int buffer_write_str(Buffer *buf, str value) except -1:
+    cdef Py_ssize_t size
+    cdef const char *utf8 = PyUnicode_AsUTF8AndSize(value, &size)
+    return buffer_write(buf, utf8, size)
+
+cdef int buffer_write_quoted(Buffer *buf, const char *src, Py_ssize_t size) except -1:
+    # Same rules as _SQL_TRANSLATE: drop control characters except tab/LF/CR, double ' and \
+    cdef Py_ssize_t i
+    cdef unsigned char c
+    buffer_reserve(buf, 2 * size + 2)
+    buf.data[buf.size] = b"'"
+    buf.size += 1
+    for i in range(size):
+        c = <unsigned char>src[i]
+        if c == b"'" or c == b"\\":
+            buf.data[buf.size] = c
+            buf.data[buf.size + 1] = c
+            buf.size += 2
+        elif (c < 32 and c != 9 and c != 10 and c != 13) or c == 127:
+            continue
+        else:
+            buf.data[buf.size] = c
+            buf.size += 1
+    buf.data[buf.size] = b"'"
+    buf.size += 1
+    return 0
+
+cdef int buffer_write_formatted(Buffer *buf, object formatter, object value, object col_name,
+                                object logger) except -1:
+    # Formatters may have side effects (external BLOB files), so a failing cell becomes NULL instead of a retry
+    try:
+        formatted = formatter(value)
+    except Exception as e:
+        logger.warning(f"Error processing value for {col_name}: {e}")
+        return buffer_write(buf, "NULL", 4)
+    return buffer_write_bytes(buf, formatted)
+
+# Same output as SQLtoMy.format_row; values other than NULL/int/float/str go through formatters[i]
+def format_row(tuple row, tuple formatters, column_names, logger):
+    cdef Buffer buf
+    cdef Py_ssize_t i
+    cdef Py_ssize_t size
+    cdef const char *utf8
+    cdef object value
+    buf.data = <char *>malloc(256)
+    if buf.data == NULL:
+        raise MemoryError()
+    buf.size = 0
+    buf.capacity = 256
+    try:
+        buffer_write(&buf, "(", 1)
+        for i in range(len(row)):
+            if i:
+                buffer_write(&buf, ", ", 2)
+            value = row[i]
+            if value is None:
+                buffer_write(&buf, "NULL", 4)
+            elif type(value) is str:
+                try:
+                    utf8 = PyUnicode_AsUTF8AndSize(value, &size)
+                except UnicodeEncodeError:
+                    # Lone surrogates: let the Python formatter apply surrogatepass
+                    buffer_write_formatted(&buf, formatters[i], value, column_names[i], logger)
+                    continue
+                buffer_write_quoted(&buf, utf8, size)
+            elif type(value) is int or type(value) is float:
+                buffer_write_str(&buf, str(value))
+            else:
+                buffer_write_formatted(&buf, formatters[i], value, column_names[i], logger)
+        buffer_write(&buf, ")", 1)
+        return PyBytes_FromStringAndSize(buf.data, buf.size)
+    finally:
+        free(buf.data)
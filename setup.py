@@ -0,0 +1,9 @@
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+# Builds the optional _sqlvalues accelerator: python setup.py build_ext --inplace
+setup(
+    name="sqlite-to-mysql",
+    py_modules=["SQLtoMy"],
+    ext_modules=cythonize([Extension("_sqlvalues", ["_sqlvalues.pyx"])]),
+)